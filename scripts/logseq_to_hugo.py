@@ -6,6 +6,7 @@ Converts Logseq pages to Hugo Markdown files.
 Usage (v0.10.0):
     python3 logseq_to_hugo.py [--clean]
     python3 logseq_to_hugo.py --graph /path/to/graph --clean
+    python3 logseq_to_hugo.py --force    # rebuild pages even if their output is up to date
 
     graph_path is read from graph_path.yaml. Config is auto-loaded from {graph}/config.yaml.
 
@@ -35,18 +36,31 @@ Supported Logseq syntax:
     configurable internal keys        → see logseq_internal_keys in config.yaml
 """
 
+import io
 import os
 import re
 import sys
 import shutil
 import argparse
 import unicodedata
+import hashlib
+import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # ──────────────────────────────────────────────
 TODAY = datetime.today().strftime('%Y-%m-%d')
 
+# Below this many pages to convert, a worker pool costs more than it saves
+PARALLEL_MIN_PAGES = 32
+
+# Digest of the page index + config of the last export, kept in the output
+# folder (dot-file: ignored by Hugo). Any change rebuilds every page.
+EXPORT_DIGEST_FILE = '.export-digest'
+
 # Valid type:: values (v0.5 model — behavioural, not section-specific)
 VALID_TYPES = {'page', 'article', 'collection', 'form'}
 
@@ -93,6 +107,87 @@ DEFAULT_THEME_PARAMS = {
     'show_tags': 'ShowTags',
 }
 
+# ──────────────────────────────────────────────
+# COMPILED PATTERNS (hot path: evaluated for every line of every page)
+# ──────────────────────────────────────────────
+
+# Properties
+_RE_PROP_LINE     = re.compile(r'^(\w[\w_-]*)::[ \t]*(.*)')
+_RE_PROP_KEY      = re.compile(r'^\w[\w_-]*::[ \t]')
+_RE_BULLET_PREFIX = re.compile(r'^-\s+')
+
+# Block structure
+_RE_COLLAPSED     = re.compile(r'\s*collapsed::\s*(true|false)')
+_RE_ID            = re.compile(r'\s*id::\s+[a-f0-9-]{8}')
+_RE_EMPTY_BULLET  = re.compile(r'^\t*-\s*$')
+_RE_BULLET        = re.compile(r'^(\t*)(- |\s{4})(.*)')
+_RE_ADMONITION_BEGIN = re.compile(r'#\+BEGIN_(\w+)\n', re.IGNORECASE)
+_RE_ADMONITION_END   = re.compile(r'\n#\+END_(\w+)', re.IGNORECASE)
+_RE_VIDEO         = re.compile(r'\{\{(?:video|youtube|embed)\s+(https?://[^\}]+)\}\}')
+_RE_WIDGET        = re.compile(r'\{\{widget\s+(\w[\w-]*)\s*\}\}')
+_RE_UNKNOWN_MACRO = re.compile(r'\{\{(?![<>])([^{}]*)\}\}')
+
+# Inline syntax
+_RE_SIZED_IMG     = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}')
+_RE_IMG_HEIGHT    = re.compile(r':height\s+(\d+)')
+_RE_IMG_WIDTH     = re.compile(r':width\s+(\d+)')
+_RE_BRACKETED_TAG = re.compile(r'#\[\[([^\]]+)\]\]')
+_RE_WIKILINK      = re.compile(r'\[\[([^\]]+)\]\]')
+_RE_LINK_URL      = re.compile(r'\]\(([^)]+)\)')
+_RE_TAG           = re.compile(r'(?<![#\w\["])#(\w[\w/-]*)')
+_RE_NON_SLUG      = re.compile(r'[^\w-]')
+
+# All inline syntaxes in one alternation, scanned once per line.
+# At a given position the first alternative wins (e.g. #[[Tag]] before #Tag).
+_RE_INLINE = re.compile(
+    r'(?P<sizeimg>!\[[^\]]*\]\([^)]+\)\{[^}]+\})'
+    r'|(?P<custom>\[(?P<custom_text>[^\]]+)\]\(\[\[(?P<custom_page>[^\]]+)\]\]\))'
+    r'|(?P<btag>#\[\[(?P<btag_name>[^\]]+)\]\])'
+    r'|(?P<wiki>\[\[(?P<wiki_page>[^\[\]]+)\]\])'
+    r'|(?P<fn_def>\[\^(?P<fn_def_id>\w+)\]:\s*)'
+    r'|(?P<fn_ref>\[\^(?P<fn_ref_id>\w+)\])'
+    r'|(?P<mark>\^\^(?P<mark_text>.+?)\^\^)'
+    r'|(?P<mark_eq>==(?P<mark_eq_text>.+?)==)'
+    r'|(?P<asset>\.\.[\/\\]assets[\/\\])'
+    r'|(?P<url>\]\((?P<url_target>[^)]+)\))'
+    r'|(?P<tag>(?<![#\w\["])#(?P<tag_name>\w[\w/-]*))'
+)
+_RE_WHITESPACE    = re.compile(r'\s+')
+
+# Logseq relative asset prefixes (both separators) → Hugo static path
+_ASSET_PREFIXES = ('../assets/', '..\\assets\\', '../assets\\', '..\\assets/')
+
+# PyYAML is imported on first use only, so runs that never read or write
+# YAML (no graph_path.yaml, no config) skip the import cost entirely.
+# Config files are parsed with the libyaml C loader when PyYAML was built
+# with it (several times faster). Generated files are dumped with the
+# pure-Python SafeDumper: they are tiny, and the C emitter escapes emoji
+# (e.g. language flags) even with allow_unicode=True.
+_yaml_module = None
+_YamlLoader  = None
+
+
+def _import_yaml():
+    """Return the PyYAML module, importing it on first call."""
+    global _yaml_module, _YamlLoader
+    if _yaml_module is None:
+        import yaml
+        _YamlLoader  = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _yaml_module = yaml
+    return _yaml_module
+
+
+def _yaml_load(stream):
+    """Safe-load YAML from a string or file object (libyaml when available)."""
+    return _import_yaml().load(stream, Loader=_YamlLoader)
+
+
+def _yaml_dump(data, **kwargs):
+    """Dump plain data (dicts, lists, scalars) to a YAML string."""
+    yaml = _import_yaml()
+    return yaml.dump(data, Dumper=yaml.SafeDumper, **kwargs)
+
+
 def load_graph_path_yaml():
     """Read graph_path from graph_path.yaml at the app root."""
     app_root = Path(__file__).resolve().parent.parent
@@ -100,9 +195,8 @@ def load_graph_path_yaml():
     if not gp_file.exists():
         return None
     try:
-        import yaml
         with open(gp_file, encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+            data = _yaml_load(f) or {}
         raw = data.get('graph_path', '')
         if raw:
             return os.path.expandvars(os.path.expanduser(raw))
@@ -134,9 +228,8 @@ def load_config(config_path):
     if not config_path:
         return defaults
     try:
-        import yaml
         with open(config_path, encoding='utf-8') as f:
-            cfg = yaml.safe_load(f)
+            cfg = _yaml_load(f)
         tp = dict(DEFAULT_THEME_PARAMS)
         tp.update(cfg.get('theme_params', {}))
         vt = cfg.get('valid_types', list(VALID_TYPES))
@@ -322,7 +415,6 @@ def generate_search_pages(languages, output_dir):
 
 def generate_i18n_from_sitemap(sitemap_entries, hugo_site_dir):
     """Generate/update i18n YAML files with nav_ keys from sitemap."""
-    import yaml as _yaml
     i18n_dir = Path(hugo_site_dir) / 'i18n'
     i18n_dir.mkdir(parents=True, exist_ok=True)
 
@@ -341,7 +433,7 @@ def generate_i18n_from_sitemap(sitemap_entries, hugo_site_dir):
         # Load existing i18n content to preserve non-nav keys
         existing = {}
         if filepath.exists():
-            existing = _yaml.safe_load(filepath.read_text(encoding='utf-8')) or {}
+            existing = _yaml_load(filepath.read_text(encoding='utf-8')) or {}
 
         # Add/update nav_ keys from sitemap
         for entry in sitemap_entries:
@@ -351,7 +443,7 @@ def generate_i18n_from_sitemap(sitemap_entries, hugo_site_dir):
 
         filepath.write_text(
             '# Auto-updated by logseq_to_hugo.py — nav_ keys from sitemap.md\n'
-            + _yaml.dump(existing, allow_unicode=True, default_flow_style=False, sort_keys=True),
+            + _yaml_dump(existing, allow_unicode=True, default_flow_style=False, sort_keys=True),
             encoding='utf-8',
         )
     print(f'🗺️  Generated i18n nav labels from sitemap.md ({len(all_langs)} language(s))')
@@ -497,7 +589,7 @@ def render_widget(name, props):
 
     if service == 'image':
         src = props.get('src', '')
-        src = re.sub(r'\.\.[\/\\]assets[\/\\]', '/assets/', src)
+        src = _rewrite_asset_paths(src)
         alt = props.get('alt', '')
         width = props.get('width', '')
         parts = [f'src="{src}"']
@@ -531,7 +623,7 @@ def apply_widgets(text, widgets, lang='fr'):
             return render_widget(name, widgets[name])
         return f'<!-- widget "{name}" not found in widgets.md -->'
 
-    return re.sub(r'\{\{widget\s+(\w[\w-]*)\s*\}\}', replace_widget, text)
+    return _RE_WIDGET.sub(replace_widget, text)
 
 
 # ──────────────────────────────────────────────
@@ -551,7 +643,6 @@ def generate_languages_data(languages, hugo_static_parent, config_was_loaded):
     If config was not loaded (--config missing), the existing file is kept
     untouched to avoid silently erasing the language settings.
     """
-    import yaml as _yaml
     data_dir = Path(hugo_static_parent) / 'data'
     out_path = data_dir / 'languages.yaml'
 
@@ -578,7 +669,7 @@ def generate_languages_data(languages, hugo_static_parent, config_was_loaded):
 
     out_path.write_text(
         '# Auto-generated by logseq_to_hugo.py — edit config.yaml languages: instead\n'
-        + _yaml.dump(output, allow_unicode=True, default_flow_style=False),
+        + _yaml_dump(output, allow_unicode=True, default_flow_style=False),
         encoding='utf-8',
     )
     print(f'🇯 Generated data/languages.yaml ({len(lang_entries)} language(s), display: {display})')
@@ -602,7 +693,6 @@ def generate_hugo_yaml(hugo_block, hosting, languages, hugo_site_dir, config_was
     If config was not loaded (--config missing), the existing file is kept
     untouched to avoid breaking the Hugo build.
     """
-    import yaml as _yaml
     out_path = Path(hugo_site_dir) / 'hugo.yaml'
 
     if not config_was_loaded:
@@ -648,7 +738,7 @@ def generate_hugo_yaml(hugo_block, hosting, languages, hugo_site_dir, config_was
 
     out_path.write_text(
         '# Auto-generated by logseq_to_hugo.py — edit config.yaml hugo: instead\n'
-        + _yaml.dump(hugo_block, allow_unicode=True, default_flow_style=False, sort_keys=False),
+        + _yaml_dump(hugo_block, allow_unicode=True, default_flow_style=False, sort_keys=False),
         encoding='utf-8',
     )
     title = hugo_block.get('title', '(untitled)')
@@ -718,17 +808,49 @@ def convert_admonitions(text):
         > **📝 NOTE**
         >
         > Content
+
+    Blocks are found with a forward scan: each #+BEGIN_X is paired with the
+    first following #+END_X (case-insensitive), without regex backtracking
+    over the block content. An unclosed #+BEGIN_X is left as-is.
     """
-    def replace(m):
-        kind    = m.group(1).upper()
-        content = m.group(2).strip()
-        icon    = ADMONITION_ICONS.get(kind, 'ℹ️')
-        body    = '\n'.join(f'> {line}' for line in content.splitlines())
-        return f'> **{icon} {kind}**\n>\n{body}'
-    return re.sub(
-        r'#\+BEGIN_(\w+)\n(.*?)\n#\+END_\1',
-        replace, text, flags=re.DOTALL | re.IGNORECASE,
-    )
+    if '#+' not in text:
+        return text
+    out, pos, start = [], 0, 0
+    while True:
+        begin = _RE_ADMONITION_BEGIN.search(text, start)
+        if not begin:
+            break
+        kind = begin.group(1)
+        body_start = begin.end()
+        for end in _RE_ADMONITION_END.finditer(text, body_start):
+            if end.group(1)[:len(kind)].lower() == kind.lower():
+                break
+        else:
+            start = begin.start() + 1  # unclosed block: keep looking further
+            continue
+        out.append(text[pos:begin.start()])
+        out.append(_render_admonition(kind, text[body_start:end.start()]))
+        pos = start = end.start(1) + len(kind)
+    if not out:
+        return text
+    out.append(text[pos:])
+    return ''.join(out)
+
+
+def _render_admonition(kind, content):
+    """Render one admonition block body as an emoji-titled blockquote."""
+    kind    = kind.upper()
+    icon    = ADMONITION_ICONS.get(kind, 'ℹ️')
+    body    = '\n'.join(f'> {line}' for line in content.strip().splitlines())
+    return f'> **{icon} {kind}**\n>\n{body}'
+
+
+def _rewrite_asset_paths(text):
+    """Rewrite Logseq relative asset paths (../assets/x) to Hugo /assets/x."""
+    for prefix in _ASSET_PREFIXES:
+        if prefix in text:
+            text = text.replace(prefix, '/assets/')
+    return text
 
 
 def convert_image_with_size(m):
@@ -742,9 +864,9 @@ def convert_image_with_size(m):
     alt   = m.group(1)
     path  = m.group(2)
     attrs = m.group(3)
-    path  = re.sub(r'\.\.[\/\\]assets[\/\\]', '/assets/', path)
-    h = re.search(r':height\s+(\d+)', attrs)
-    w = re.search(r':width\s+(\d+)',  attrs)
+    path  = _rewrite_asset_paths(path)
+    h = _RE_IMG_HEIGHT.search(attrs)
+    w = _RE_IMG_WIDTH.search(attrs)
     parts = [f'src="{path}"']
     if alt: parts.append(f'alt="{alt}"')
     # Width alone preserves aspect ratio; fall back to height if no width
@@ -818,17 +940,48 @@ def _responsive_iframe(src, padding='56.25%', fixed_height=None):
     )
 
 
-def extract_tags(text):
-    """Extract all #Tags and #[[Tag Name]] from content body (for Hugo front matter)."""
-    # Skip the properties block at the top
-    body = re.split(r'\n(?![\w_-]+::)', text, maxsplit=1)[-1]
+def _properties_block_end(text):
+    """Return the offset where the page body starts.
+
+    The properties block is the run of leading key:: value, - key:: value
+    and blank lines — the same lines convert_content drops. Lines are
+    scanned forward with str.find and the scan stops at the first body line.
+    """
+    pos, size = 0, len(text)
+    while pos < size:
+        end = text.find('\n', pos)
+        if end < 0:
+            end = size
+        candidate = text[pos:end].strip()
+        if candidate:
+            if candidate[:1] == '-' and candidate[1:2].isspace():
+                candidate = candidate[1:].lstrip()
+            if not _RE_PROP_KEY.match(candidate):
+                break
+        pos = end + 1
+    return min(pos, size)
+
+
+def _collect_tags(text, tags):
+    """Add the #Tags and #[[Tag Name]] found in *text* to the *tags* set."""
     # Remove markdown link URLs to avoid false positives (e.g. https://.../#fragment)
-    body_no_urls = re.sub(r'\]\([^)]+\)', ']()', body)
+    text_no_urls = _RE_LINK_URL.sub(']()', text)
     # Simple #Tag
-    simple = re.findall(r'(?<![#\w\["])#(\w[\w/-]*)', body_no_urls)
+    tags.update(_RE_TAG.findall(text_no_urls))
     # #[[Tag Name]] with spaces
-    bracketed = re.findall(r'#\[\[([^\]]+)\]\]', body_no_urls)
-    return sorted(set(simple + bracketed))
+    tags.update(_RE_BRACKETED_TAG.findall(text_no_urls))
+
+
+def extract_tags(text):
+    """Extract all #Tags and #[[Tag Name]] from content body (for Hugo front matter).
+
+    process_file gets the same tags from convert_content(..., tags=...)
+    while converting; this standalone form is for callers needing tags only.
+    """
+    tags = set()
+    # Skip the properties block at the top
+    _collect_tags(text[_properties_block_end(text):], tags)
+    return sorted(tags)
 
 
 def _normalise_page_key(name):
@@ -839,7 +992,7 @@ def _normalise_page_key(name):
     """
     if not isinstance(name, str):
         return ''
-    compact = re.sub(r'\s+', ' ', name).strip()
+    compact = _RE_WHITESPACE.sub(' ', name).strip()
     return unicodedata.normalize('NFC', compact)
 
 
@@ -870,72 +1023,84 @@ def _resolve_page_link(page_name, page_index):
     return f'/{lang}/{slug}/'
 
 
+def make_inline_converter(lang, page_index=None):
+    """Return convert(line) with *lang* and *page_index* baked in.
+
+    Built once per page and reused for every line: the tag URL prefix is
+    formatted once and the _RE_INLINE dispatch callbacks are created once,
+    instead of on every apply_inline_conversions() call.
+
+    All inline syntaxes are matched by one compiled alternation (_RE_INLINE)
+    in a single left-to-right scan; lines without any trigger character skip
+    the regex engine entirely.
+    """
+    tag_prefix = f'](/{lang}/tags/'
+    sub = _RE_INLINE.sub
+
+    def _make_dispatch(with_tags):
+        # Text that is emitted as content (highlights, link labels,
+        # unresolved links) is converted recursively. Markdown link targets
+        # ](url) are converted too, but without #Tag conversion
+        # (e.g. https://.../#fragment).
+        def _dispatch(m):
+            kind = m.lastgroup
+            if kind == 'tag':
+                if not with_tags:
+                    return m.group()
+                tag = m.group('tag_name')
+                return '[#' + tag + tag_prefix + tag.lower() + '/)'
+            if kind == 'url':
+                return '](' + sub(_dispatch_no_tags, m.group('url_target')) + ')'
+            if kind == 'asset':
+                return '/assets/'
+            if kind == 'mark' or kind == 'mark_eq':
+                return '<mark>' + sub(_dispatch, m.group(kind + '_text')) + '</mark>'
+            if kind == 'wiki':
+                # [[Page Name]] references → resolved link or plain text
+                page_name = m.group('wiki_page')
+                url = _resolve_page_link(page_name, page_index)
+                label = sub(_dispatch, page_name)
+                return f'[{label}]({url})' if url else label
+            if kind == 'btag':
+                # #[[Tag Name]] → Hugo taxonomy link
+                tag = m.group('btag_name')
+                slug = _RE_NON_SLUG.sub('-', tag.lower()).strip('-')
+                return '[#' + tag + tag_prefix + slug + '/)'
+            if kind == 'custom':
+                # [Custom text]([[Page Name]]) → resolved link or plain text
+                url = _resolve_page_link(m.group('custom_page'), page_index)
+                label = sub(_dispatch, m.group('custom_text'))
+                return f'[{label}]({url})' if url else label
+            if kind == 'fn_def':
+                # Footnote definitions [^n]: text → anchor target in-place
+                return f'<span id="fn-{m.group("fn_def_id")}"></span>'
+            if kind == 'fn_ref':
+                # Footnote references [^n] → clickable anchor
+                ref = m.group('fn_ref_id')
+                return f'<sup><a href="#fn-{ref}">{ref}</a></sup>'
+            # Sized images → HTML <img>
+            return convert_image_with_size(_RE_SIZED_IMG.match(m.group()))
+        return _dispatch
+
+    _dispatch_tags    = _make_dispatch(True)
+    _dispatch_no_tags = _make_dispatch(False)
+
+    def convert(line):
+        if ('[' not in line and '#' not in line and '^^' not in line
+                and '==' not in line and '..' not in line):
+            return line
+        return sub(_dispatch_tags, line)
+
+    return convert
+
+
 def apply_inline_conversions(line, lang, page_index=None):
-    """Apply all inline conversions to a single content line."""
-    # Sized images → HTML <img>
-    line = re.sub(
-        r'!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}',
-        convert_image_with_size, line,
-    )
-    # Plain asset paths → Hugo rewrite
-    line = re.sub(r'\.\.[\/\\]assets[\/\\]', '/assets/', line)
-    # Highlight ^^text^^ → <mark>
-    line = re.sub(r'\^\^(.+?)\^\^', r'<mark>\1</mark>', line)
-    # Highlight ==text== → <mark>
-    line = re.sub(r'==(.+?)==', r'<mark>\1</mark>', line)
-    # Footnote references [^n] → clickable anchor (but NOT definitions [^n]:)
-    line = re.sub(
-        r'\[\^(\w+)\](?!:)',
-        lambda m: f'<sup><a href="#fn-{m.group(1)}">{m.group(1)}</a></sup>',
-        line,
-    )
-    # Footnote definitions [^n]: text → anchor target in-place
-    line = re.sub(
-        r'\[\^(\w+)\]:\s*',
-        lambda m: f'<span id="fn-{m.group(1)}"></span>',
-        line,
-    )
-    # [Custom text]([[Page Name]]) → resolved link or plain text
-    def _replace_custom_link(m):
-        display = m.group(1)
-        page_name = m.group(2)
-        url = _resolve_page_link(page_name, page_index)
-        if url:
-            return f'[{display}]({url})'
-        return display
-    line = re.sub(r'\[([^\]]+)\]\(\[\[([^\]]+)\]\]\)', _replace_custom_link, line)
-    # #[[Tag Name]] → Hugo taxonomy link (must come before [[Page]] handling)
-    def _replace_bracketed_tag(m):
-        tag = m.group(1)
-        slug = re.sub(r'[^\w-]', '-', tag.lower()).strip('-')
-        return f'[#{tag}](/{lang}/tags/{slug}/)'
-    line = re.sub(r'#\[\[([^\]]+)\]\]', _replace_bracketed_tag, line)
-    # [[Page Name]] references → resolved link or plain text
-    def _replace_page_link(m):
-        page_name = m.group(1)
-        url = _resolve_page_link(page_name, page_index)
-        if url:
-            return f'[{page_name}]({url})'
-        return page_name
-    line = re.sub(r'\[\[([^\]]+)\]\]', _replace_page_link, line)
-    # #Tags → Hugo taxonomy link
-    # Protect markdown link URLs from being matched: temporarily replace ](url) sections
-    _link_urls = []
-    def _stash_url(m):
-        _link_urls.append(m.group(1))
-        return f'](\x00LINK{len(_link_urls) - 1}\x00)'
-    line = re.sub(r'\]\(([^)]+)\)', _stash_url, line)
-    # Now apply #Tag conversion safely (no URLs to pollute)
-    line = re.sub(
-        r'(?<![#\w\["])#(\w[\w/-]*)',
-        lambda m: f'[#{m.group(1)}](/{lang}/tags/{m.group(1).lower()}/)',
-        line,
-    )
-    # Restore stashed URLs
-    def _restore_url(m):
-        return f']({_link_urls[int(m.group(1))]})'
-    line = re.sub(r'\]\(\x00LINK(\d+)\x00\)', _restore_url, line)
-    return line
+    """Apply all inline conversions to a single content line.
+
+    One-off convenience wrapper; convert_content() builds a converter once
+    per page with make_inline_converter() instead.
+    """
+    return make_inline_converter(lang, page_index)(line)
 
 
 # ──────────────────────────────────────────────
@@ -949,14 +1114,41 @@ def parse_logseq_properties(text):
       - Page-level:  key:: value
       - Block-level: - key:: value  (Logseq-native outline format)
     """
+    return _parse_property_lines(io.StringIO(text, newline=None))
+
+
+def read_page_properties(path):
+    """Parse the properties block of a page file without reading past it.
+
+    Used by the incremental export to resolve a page's output path cheaply.
+    """
+    with open(path, encoding='utf-8') as f:
+        return _parse_property_lines(f)
+
+
+def _is_property_key(key):
+    """True if *key* is a valid property name (regex: \\w[\\w_-]*)."""
+    return key[:1] not in ('', '-') and key.replace('-', '_').replace('_', 'a').isalnum()
+
+
+def _parse_property_lines(lines):
+    """Consume *lines* up to the end of the properties block → props dict.
+
+    Lines are iterated lazily and parsed with str methods only: the block
+    ends at the first non-empty, non-bullet line without a key:: value.
+    """
     props = {}
-    for line in text.splitlines():
-        # Strip leading bullet marker so block-level "- key:: value" is handled
-        candidate = re.sub(r'^-\s+', '', line.strip())
-        m = re.match(r'^(\w[\w_-]*)::[ \t]*(.*)', candidate)
-        if m:
-            props[m.group(1).lower()] = m.group(2).strip()
-        elif line.strip() and not line.startswith('-'):
+    for line in lines:
+        candidate = line.strip()
+        if '::' in candidate:
+            # Strip leading bullet marker so block-level "- key:: value" is handled
+            if candidate[:1] == '-' and candidate[1:2].isspace():
+                candidate = candidate[1:].lstrip()
+            key, _, val = candidate.partition('::')
+            if _is_property_key(key):
+                props[key.lower()] = val.strip()
+                continue
+        if candidate and not line.startswith('-'):
             break  # end of properties block (non-empty, non-bullet line)
     return props
 
@@ -965,10 +1157,29 @@ def parse_logseq_properties(text):
 # LOGSEQ CONTENT → HUGO MARKDOWN CONVERTER
 # ──────────────────────────────────────────────
 
-def convert_content(text, internal_keys, lang='fr', widgets=None, page_index=None):
+# Markdown list prefix by Logseq tab depth: depth 0 is a paragraph,
+# depth n is a list item indented by 2 * (n - 1) spaces.
+_INDENTS = [''] + [('  ' * (t - 1)) + '- ' for t in range(1, 32)]
+
+
+def _is_raw_media_html(line):
+    """True if the line opens with a raw <img ...> or <video ...> tag."""
+    stripped = line.lstrip()
+    if stripped.startswith('<img'):
+        return stripped[4:5].isspace()
+    if stripped.startswith('<video'):
+        return stripped[6:7].isspace()
+    return False
+
+
+def convert_content(text, internal_keys, lang='fr', widgets=None, page_index=None, tags=None):
     """
     Converts a Logseq page body to Hugo-compatible Markdown/HTML.
 
+    tags: optional set; when given, the #Tags / #[[Tags]] of every rendered
+    line are added to it during the same pass (front matter tags), so the
+    page does not need a separate extract_tags() scan.
+
     Processing order:
     1. Admonitions #+BEGIN_X...#+END_X (multi-line, global pass)
     2. Media embeds {{video|embed url}} (multi-line)
@@ -981,84 +1192,90 @@ def convert_content(text, internal_keys, lang='fr', widgets=None, page_index=Non
     """
     # ── Global multi-line passes ─────────────────────────────────────
     text = convert_admonitions(text)
-    text = re.sub(
-        r'\{\{(?:video|youtube|embed)\s+(https?://[^\}]+)\}\}',
-        convert_media_embed, text,
-    )
-    lines    = text.splitlines()
-    output   = []
-    in_props = True
-
-    for line in lines:
+    text = _RE_VIDEO.sub(convert_media_embed, text)
+    # Lines are read lazily (universal newlines) and converted lines are
+    # appended to a single buffer, joined once at the end.
+    buf       = []
+    emit      = buf.append
+    blank_run = 0
+    in_props  = True
+    convert_inline = make_inline_converter(lang, page_index)
+
+    for line in io.StringIO(text, newline=None):
+        line = line.rstrip('\n')
         # Skip the properties block at the top of the file
         if in_props:
             # Support both page-level (key:: value) and block-level (- key:: value)
-            candidate = re.sub(r'^-\s+', '', line.strip())
-            if re.match(r'^\w[\w_-]*::[ \t]', candidate) or line.strip() == '':
+            candidate = _RE_BULLET_PREFIX.sub('', line.strip())
+            if _RE_PROP_KEY.match(candidate) or line.strip() == '':
                 continue
             else:
                 in_props = False
 
-        # Always strip collapsed:: and id:: (Logseq serialized metadata)
-        if re.match(r'\s*collapsed::\s*(true|false)', line):
-            continue
-        if re.match(r'\s*id::\s+[a-f0-9-]{8}', line):
-            continue
+        # Always strip collapsed:: and id:: (Logseq serialized metadata).
+        # Cheap str gates first: the regexes only confirm the rare hits.
+        lstripped = line.lstrip()
+        if lstripped.startswith(('collapsed::', 'id::')):
+            if _RE_COLLAPSED.match(line) or _RE_ID.match(line):
+                continue
 
-        # Empty Logseq bullet: bare "-" with no content → blank line
-        if re.match(r'^\t*-\s*$', line):
-            output.append('')
-            continue
+        # Bullets start with "-", a tab or indentation; anything else is a
+        # plain paragraph line and skips the bullet regexes altogether.
+        first = line[:1]
+        is_bullet_like = first == '-' or first == '\t' or first.isspace()
 
-        # Logseq bullets
-        indent_match = re.match(r'^(\t*)(- |\s{4})(.*)', line)
-        if indent_match:
-            tabs    = len(indent_match.group(1))
-            content = indent_match.group(3)
-
-            # Inline property inside a bullet: "key:: value"
-            prop_m = re.match(r'^(\w[\w_-]*)::[ \t]*(.*)', content.strip())
-            if prop_m:
-                key = prop_m.group(1).lower()
-                val = prop_m.group(2).strip()
-                if key in internal_keys:
-                    continue          # Internal key → drop entirely
+        # Empty Logseq bullet: bare "-" with no content → blank line
+        if is_bullet_like and _RE_EMPTY_BULLET.match(line):
+            line = ''
+        else:
+            # Logseq bullets
+            indent_match = _RE_BULLET.match(line) if is_bullet_like else None
+            if indent_match:
+                tabs    = len(indent_match.group(1))
+                content = indent_match.group(3)
+
+                # Inline property inside a bullet: "key:: value"
+                prop_m = _RE_PROP_LINE.match(content.strip())
+                if prop_m:
+                    key = prop_m.group(1).lower()
+                    val = prop_m.group(2).strip()
+                    if key in internal_keys:
+                        continue          # Internal key → drop entirely
+                    else:
+                        content = val     # Custom key (logo::, cover::...) → keep value only
+
+                if tabs < len(_INDENTS):
+                    prefix = _INDENTS[tabs]
                 else:
-                    content = val     # Custom key (logo::, cover::...) → keep value only
+                    prefix = ('  ' * (tabs - 1)) + '- '
+            else:
+                # Non-bullet lines (headings ##, blockquotes >, paragraphs...)
+                content, prefix = line, ''
+
+            if tags is not None and '#' in content:
+                _collect_tags(content, tags)
+            line = prefix + convert_inline(content)
+
+        # Collapse runs of more than 2 consecutive blank lines
+        if not line.strip():
+            blank_run += 1
+            if blank_run <= 2:
+                emit(line)
+            continue
 
-            content = apply_inline_conversions(content, lang, page_index=page_index)
-            line    = content if tabs == 0 else ('  ' * (tabs - 1)) + '- ' + content
+        # Ensure blank lines before and after <img> and <video> blocks.
+        # goldmark requires blank lines around raw HTML to render it correctly.
+        if _is_raw_media_html(line):
+            if buf and blank_run == 0:
+                emit('')
+            emit(line)
+            emit('')
+            blank_run = 1
         else:
-            # Non-bullet lines (headings ##, blockquotes >, paragraphs...)
-            line = apply_inline_conversions(line, lang, page_index=page_index)
-
-        output.append(line)
-
-    # Ensure blank lines before and after <img> and <video> blocks.
-    # goldmark requires blank lines around raw HTML to render it correctly.
-    spaced = []
-    for i, ln in enumerate(output):
-        if re.match(r'^\s*<(?:img|video)\s', ln):
-            if spaced and spaced[-1].strip() != '':
-                spaced.append('')
-            spaced.append(ln)
-            spaced.append('')
-        else:
-            spaced.append(ln)
-    output = spaced
-
-    # Collapse runs of more than 2 consecutive blank lines
-    cleaned, blank_count = [], 0
-    for line in output:
-        if line.strip() == '':
-            blank_count += 1
-            if blank_count <= 2:
-                cleaned.append(line)
-        else:
-            blank_count = 0
-            cleaned.append(line)
+            emit(line)
+            blank_run = 0
 
-    result = '\n'.join(cleaned).strip()
+    result = '\n'.join(buf).strip()
     # Apply widgets AFTER all inline conversions so that HTML inside
     # widgets (e.g. hex colours like #40DCA5) is not mangled by the
     # Logseq #tag → link conversion.
@@ -1071,7 +1288,7 @@ def convert_content(text, internal_keys, lang='fr', widgets=None, page_index=Non
         raw = m.group(0)
         print(f'  ⚠️  Unknown macro escaped: {raw}')
         return f'<!-- {raw} -->'
-    result = re.sub(r'\{\{(?![<>])([^{}]*)\}\}', _escape_unknown_macro, result)
+    result = _RE_UNKNOWN_MACRO.sub(_escape_unknown_macro, result)
 
     return result
 
@@ -1139,7 +1356,7 @@ def resolve_props(props, source_file, sections_map, valid_types, legacy_sections
         if label and title == stem:
             title = label
 
-    slug  = props.get('slug', re.sub(r'[^\w-]', '-', title.lower()).strip('-'))
+    slug  = props.get('slug', _RE_NON_SLUG.sub('-', title.lower()).strip('-'))
 
     # translationKey: explicit wins, else auto
     tk = props.get('translationkey', '')
@@ -1177,7 +1394,7 @@ def build_front_matter(props, source_file, tags=None, theme_params=None, sitemap
     # Resolved properties (set by resolve_props before calling this)
     title   = props.get('_title', Path(source_file).stem)
     section = props.get('_section', '')
-    slug    = props.get('_slug', re.sub(r'[^\w-]', '-', title.lower()))
+    slug    = props.get('_slug', _RE_NON_SLUG.sub('-', title.lower()))
     tk      = props.get('_translationkey', '')
     ptype   = props.get('_page_type', 'page')  # behavioural type
 
@@ -1219,25 +1436,29 @@ def build_front_matter(props, source_file, tags=None, theme_params=None, sitemap
     # Hugo type = section name (not the behavioural type)
     hugo_type = section if section else 'page'
 
-    fm = ['---', f'title: "{title}"', f'slug: "{slug}"', f'type: "{hugo_type}"', f'date: {date}']
-    if desc:  fm.append(f'description: "{desc}"')
-    if order: fm.append(f'weight: {order}')
-    if tk:    fm.append(f'translationKey: "{tk}"')
-    if toc and theme_params.get('toc'):      fm.append(f"{theme_params['toc']}: true")
-    if toc and theme_params.get('toc_open'): fm.append(f"{theme_params['toc_open']}: true")
-    if tags:  fm.append('tags: [' + ', '.join(f'"{t}"' for t in tags) + ']')
-    fm.append('---')
-    return '\n'.join(fm)
+    toc_key      = theme_params.get('toc') if toc else None
+    toc_open_key = theme_params.get('toc_open') if toc else None
+    return (
+        f'---\ntitle: "{title}"\nslug: "{slug}"\ntype: "{hugo_type}"\ndate: {date}'
+        + (f'\ndescription: "{desc}"' if desc else '')
+        + (f'\nweight: {order}' if order else '')
+        + (f'\ntranslationKey: "{tk}"' if tk else '')
+        + (f'\n{toc_key}: true' if toc_key else '')
+        + (f'\n{toc_open_key}: true' if toc_open_key else '')
+        + ('\ntags: [' + ', '.join(f'"{t}"' for t in tags) + ']' if tags else '')
+        + '\n---'
+    )
 
 
 # ──────────────────────────────────────────────
 # HUGO OUTPUT PATH RESOLVER
 # ──────────────────────────────────────────────
 
-def output_path(props, output_dir, sections_map, collection_types=None):
+def output_path(props, output_dir_path, sections_map, collection_types=None):
     """Resolve the output path inside content/<lang>/<section>/.
 
     Uses resolved props (_section, _slug, _page_type) set by resolve_props().
+    output_dir_path must already be a Path (built once by main()).
     """
     lang    = props.get('lang', 'fr').lower().replace('_', '-')  # zh-TW → zh-tw
     section = props.get('_section', '')
@@ -1246,10 +1467,6 @@ def output_path(props, output_dir, sections_map, collection_types=None):
 
     # Map section name to Hugo folder via sitemap/legacy
     folder = sections_map.get(section, section)
-    if folder:
-        dir_path = Path(output_dir) / lang / folder
-    else:
-        dir_path = Path(output_dir) / lang
 
     # article type → individual file; everything else → _index.md
     if ptype == 'article':
@@ -1257,7 +1474,9 @@ def output_path(props, output_dir, sections_map, collection_types=None):
     else:
         filename = '_index.md'
 
-    return dir_path / filename
+    if folder:
+        return output_dir_path.joinpath(lang, folder, filename)
+    return output_dir_path.joinpath(lang, filename)
 
 
 # ──────────────────────────────────────────────
@@ -1275,7 +1494,7 @@ def extract_journal_blocks(journal_file):
     Date is auto-deduced from the journal filename (``2026_03_28.md`` →
     ``2026-03-28``) unless ``date::`` is set explicitly in the block.
     """
-    text = Path(journal_file).read_text(encoding='utf-8')
+    text = Path(journal_file).read_bytes().decode('utf-8')
     if not text.strip():
         return []
 
@@ -1305,7 +1524,7 @@ def extract_journal_blocks(journal_file):
         first_line_text = None
 
         # Check if first line itself is a property
-        m = re.match(r'^(\w[\w_-]*)::[ \t]*(.*)', first_line.strip())
+        m = _RE_PROP_LINE.match(first_line.strip())
         if m:
             props[m.group(1).lower()] = m.group(2).strip()
         else:
@@ -1361,7 +1580,7 @@ def extract_journal_blocks(journal_file):
         # Use first line text as title if no explicit title:: property
         if first_line_text and 'title' not in props:
             # Strip Logseq link brackets: [[My Title]] → My Title
-            title = re.sub(r'\[\[([^\]]+)\]\]', r'\1', first_line_text).strip()
+            title = _RE_WIKILINK.sub(r'\1', first_line_text).strip()
             if title:
                 props['title'] = title
 
@@ -1384,6 +1603,21 @@ def extract_journal_blocks(journal_file):
 # PAGE INDEX (2-pass link resolution)
 # ──────────────────────────────────────────────
 
+def _list_markdown_files(directory):
+    """Sorted Paths of the *.md files directly inside *directory*.
+
+    One os.scandir() pass filtered on the plain entry name (no fnmatch
+    pattern, no Path object for non-.md entries); DirEntry.is_file() answers
+    from the cached directory data. Names are sorted as strings before the
+    Paths are built.
+    """
+    with os.scandir(directory) as it:
+        names = [e.name for e in it if e.name.endswith('.md') and e.is_file()]
+    names.sort()
+    directory = Path(directory)
+    return [directory / name for name in names]
+
+
 def build_page_index(pages_dir, sections_map, valid_types=None, legacy_sections=None,
                      journals_dir=None, journal_articles_enabled=False):
     """Build an index of all publishable pages for [[Page]] link resolution.
@@ -1398,14 +1632,9 @@ def build_page_index(pages_dir, sections_map, valid_types=None, legacy_sections=
     index = {}
 
     # Index pages/
-    for md_file in sorted(pages_dir.glob('*.md')):
-        text = md_file.read_text(encoding='utf-8')
-        props = parse_logseq_properties(text)
-        if not props.get('type', '').strip():
-            continue
-        if props.get('public', '').strip().lower() == 'false':
-            continue
-        if props.get('draft', '').strip().lower() == 'true':
+    for md_file in _list_markdown_files(pages_dir):
+        props = read_page_properties(md_file)
+        if not _is_publishable(props):
             continue
         resolve_props(props, md_file, sections_map, _valid, _legacy)
         page_name = md_file.stem
@@ -1423,14 +1652,10 @@ def build_page_index(pages_dir, sections_map, valid_types=None, legacy_sections=
 
     # Index journal articles
     if journal_articles_enabled and journals_dir and journals_dir.exists():
-        for journal_file in sorted(journals_dir.glob('*.md')):
+        for journal_file in _list_markdown_files(journals_dir):
             for page_text, source_label in extract_journal_blocks(journal_file):
                 props = parse_logseq_properties(page_text)
-                if not props.get('type', '').strip():
-                    continue
-                if props.get('public', '').strip().lower() == 'false':
-                    continue
-                if props.get('draft', '').strip().lower() == 'true':
+                if not _is_publishable(props):
                     continue
                 resolve_props(props, journal_file, sections_map, _valid, _legacy)
                 title = props.get('_title', journal_file.stem)
@@ -1453,22 +1678,117 @@ def build_page_index(pages_dir, sections_map, valid_types=None, legacy_sections=
 # FILE PROCESSOR
 # ──────────────────────────────────────────────
 
-def process_file(src_path, output_dir, sections_map, internal_keys, theme_params=None,
-                  widgets=None, collection_types=None, valid_types=None, legacy_sections=None,
-                  text=None, page_index=None, sitemap_labels=None):
-    if text is None:
-        text = Path(src_path).read_text(encoding='utf-8')
-    props = parse_logseq_properties(text)
-
-    # v0.5: a page is publishable when type:: is defined (replaces public:: true)
+def _is_publishable(props):
+    """v0.5: a page is published when type:: is set and not opted out."""
     if not props.get('type', '').strip():
-        return None, []
-
+        return False
     # Explicit opt-out: public:: false or draft:: true
     if props.get('public', '').strip().lower() == 'false':
-        return None, []
+        return False
     if props.get('draft', '').strip().lower() == 'true':
-        return None, []
+        return False
+    return True
+
+
+def _latest_mtime(*paths):
+    """Most recent mtime among *paths* (None and missing files are ignored)."""
+    latest = 0.0
+    for p in paths:
+        if not p:
+            continue
+        try:
+            latest = max(latest, os.stat(p).st_mtime)
+        except FileNotFoundError:
+            pass
+    return latest
+
+
+def export_digest(page_index, *inputs):
+    """Digest of everything a page's output depends on besides its own source.
+
+    *page_index* carries the publish state, slug, section and title of every
+    other page (and journal article) that [[links]] resolve against; *inputs*
+    are the resolved config values passed to process_file(). Sets are
+    hashed in sorted order so the digest is stable across runs.
+    """
+    payload = json.dumps(
+        [page_index, *inputs], sort_keys=True, ensure_ascii=False,
+        default=lambda o: sorted(o) if isinstance(o, (set, frozenset)) else repr(o),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def read_export_digest(output_dir):
+    """Digest stored by the previous export in *output_dir* ('' if none)."""
+    try:
+        return (Path(output_dir) / EXPORT_DIGEST_FILE).read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        return ''
+
+
+def page_output_path(src_path, output_dir, sections_map, valid_types=None, legacy_sections=None,
+                     collection_types=None, sitemap_labels=None):
+    """Output path of *src_path*, or None when the page is not published.
+
+    Only the properties block is read — enough to resolve the output path.
+    """
+    props = read_page_properties(src_path)
+    if not _is_publishable(props):
+        return None
+    resolve_props(props, src_path, sections_map, valid_types or VALID_TYPES,
+                  legacy_sections or DEFAULT_SECTIONS, sitemap_labels=sitemap_labels)
+    if not isinstance(output_dir, Path):
+        output_dir = Path(output_dir)
+    return output_path(props, output_dir, sections_map, collection_types=collection_types)
+
+
+def _output_is_current(src_path, out, inputs_mtime=0.0):
+    """True if *out* exists and is at least as recent as the source and inputs."""
+    try:
+        out_mtime = out.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return out_mtime >= max(Path(src_path).stat().st_mtime, inputs_mtime)
+
+
+def up_to_date_output(src_path, output_dir, sections_map, valid_types=None, legacy_sections=None,
+                      collection_types=None, sitemap_labels=None, inputs_mtime=0.0):
+    """Return the output path of *src_path* if it needs no rebuild, else None.
+
+    A page is up to date when its output file exists and is at least as
+    recent as both the page source and *inputs_mtime* (latest change of the
+    inputs shared by every page: config, sitemap, widgets, this script).
+    """
+    out = page_output_path(src_path, output_dir, sections_map, valid_types=valid_types,
+                           legacy_sections=legacy_sections, collection_types=collection_types,
+                           sitemap_labels=sitemap_labels)
+    if out is not None and _output_is_current(src_path, out, inputs_mtime):
+        return str(out)
+    return None
+
+
+def render_page(src_path, output_dir, sections_map, internal_keys, theme_params=None,
+                widgets=None, collection_types=None, valid_types=None, legacy_sections=None,
+                text=None, page_index=None, sitemap_labels=None):
+    """Convert one Logseq page without writing anything.
+
+    output_dir may be a str or a Path. Returns (output_path, data, warnings)
+    with the encoded Hugo page, or (None, None, []) when the page is not
+    published. Safe to run in worker processes: writing is left to the
+    caller, in page order.
+    """
+    if text is None:
+        # One read + one decode: no TextIOWrapper / incremental decoder.
+        # CRLF / CR are normalised here as read_text() would: the global
+        # passes (admonitions, media embeds) expect bare \n.
+        text = Path(src_path).read_bytes().decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+    props = parse_logseq_properties(text)
+
+    # v0.5: a page is publishable when type:: is defined (replaces public:: true)
+    if not _is_publishable(props):
+        return None, None, []
 
     _valid  = valid_types or VALID_TYPES
     _legacy = legacy_sections or DEFAULT_SECTIONS
@@ -1476,16 +1796,87 @@ def process_file(src_path, output_dir, sections_map, internal_keys, theme_params
                              sitemap_labels=sitemap_labels)
 
     lang         = props.get('lang', 'fr').lower()
-    tags         = extract_tags(text)
-    front_matter = build_front_matter(props, src_path, tags=tags or None,
+    # Body conversion and tag extraction share a single pass over the lines
+    tags         = set()
+    body         = convert_content(text, internal_keys, lang=lang, widgets=widgets,
+                                   page_index=page_index, tags=tags)
+    front_matter = build_front_matter(props, src_path, tags=sorted(tags) or None,
                                       theme_params=theme_params, sitemap_labels=sitemap_labels)
-    body         = convert_content(text, internal_keys, lang=lang, widgets=widgets, page_index=page_index)
     hugo_content = front_matter + '\n\n' + body
 
+    if not isinstance(output_dir, Path):
+        output_dir = Path(output_dir)
     out = output_path(props, output_dir, sections_map, collection_types=collection_types)
+    return out, hugo_content.encode('utf-8'), warnings
+
+
+def process_file(src_path, output_dir, sections_map, internal_keys, theme_params=None,
+                  widgets=None, collection_types=None, valid_types=None, legacy_sections=None,
+                  text=None, page_index=None, sitemap_labels=None):
+    """Convert one Logseq page and write it into the Hugo content folder.
+
+    output_dir may be a str or a Path (main() passes the Path it built once).
+    Returns (output_path, warnings, written); output_path is None when the
+    page is not published. written is False when the existing output was
+    already byte-identical and was left untouched.
+    """
+    out, data, warnings = render_page(
+        src_path, output_dir, sections_map, internal_keys, theme_params=theme_params,
+        widgets=widgets, collection_types=collection_types, valid_types=valid_types,
+        legacy_sections=legacy_sections, text=text, page_index=page_index,
+        sitemap_labels=sitemap_labels)
+    if out is None:
+        return None, [], False
+    return str(out), warnings, _write_page(out, data)
+
+
+def _write_page(out, data):
+    """Create the output folder if needed and write *data* unless identical."""
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(hugo_content, encoding='utf-8')
-    return str(out), warnings
+    return _write_if_changed(out, data)
+
+
+def _write_if_changed(path, data):
+    """Write *data* to *path* unless the file already holds exactly these bytes.
+
+    Identical outputs are not rewritten, so Hugo's incremental rebuild does
+    not re-render them; their mtime is refreshed instead so the incremental
+    export sees them as up to date. Returns True if the file was written.
+    """
+    try:
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    if existing == data:
+        os.utime(path)
+        return False
+    path.write_bytes(data)
+    return True
+
+
+# ──────────────────────────────────────────────
+# ASSETS
+# ──────────────────────────────────────────────
+
+def _fast_copy(src, dst, force=False):
+    """Copy *src* to *dst* unless *dst* already has the same size and is newer.
+
+    shutil.copyfile lets the kernel move the bytes (sendfile/copy_file_range
+    on Linux); only the timestamps are carried over, so the next run can
+    detect the unchanged file. Returns True if the file was copied.
+    """
+    st = src.stat()
+    if not force:
+        try:
+            dst_st = dst.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            if dst_st.st_size == st.st_size and dst_st.st_mtime >= st.st_mtime:
+                return False
+    shutil.copyfile(src, dst)
+    os.utime(dst, (st.st_atime, st.st_mtime))
+    return True
 
 
 # ──────────────────────────────────────────────
@@ -1498,6 +1889,8 @@ def main():
     parser.add_argument('--output', default=None, help='Hugo content/ folder (default: site/content)')
     parser.add_argument('--config', default=None,  help='Path to config.yaml (default: {graph}/config.yaml)')
     parser.add_argument('--clean',  action='store_true', help='Remove output folder before export')
+    parser.add_argument('--force',  action='store_true',
+                        help='Rebuild every page and asset, even when the output is newer than the source')
     args = parser.parse_args()
 
     # 1. Resolve graph directory: CLI > graph_path.yaml > error
@@ -1600,11 +1993,14 @@ def main():
     if assets_src.exists():
         static_dest.mkdir(parents=True, exist_ok=True)
         copied_assets = 0
+        unchanged_assets = 0
         for asset_file in assets_src.iterdir():
             if asset_file.is_file():
-                shutil.copy2(asset_file, static_dest / asset_file.name)
-                copied_assets += 1
-        print(f"🖼️  Copied {copied_assets} asset(s): {assets_src} → {static_dest}")
+                if _fast_copy(asset_file, static_dest / asset_file.name, force=args.force):
+                    copied_assets += 1
+                else:
+                    unchanged_assets += 1
+        print(f"🖼️  Copied {copied_assets} asset(s), {unchanged_assets} unchanged: {assets_src} → {static_dest}")
     else:
         print(f"  ℹ️  No assets folder found in {graph_dir}")
 
@@ -1640,6 +2036,8 @@ def main():
         print('  ℹ️  Search disabled (search_enabled: false in config.yaml)')
 
     exported    = []
+    identical   = 0
+    unchanged   = []
     skipped     = []
     all_warnings = []
 
@@ -1655,16 +2053,67 @@ def main():
         print(f"🔗 Page index: {len(page_index)} publishable page(s) indexed for link resolution")
 
     # ── Pass 2: convert and export ────────────────────────────────────
-    for md_file in sorted(pages_dir.glob('*.md')):
-        result, warnings = process_file(
-            md_file, output_dir, sections_map, internal_keys,
-            theme_params=theme_params, widgets=widgets,
-            collection_types=collection_types,
-            valid_types=valid_types, legacy_sections=legacy_sections,
-            page_index=page_index, sitemap_labels=sitemap_labels)
-        if result:
+    # Incremental: pages whose output is newer than the page and than every
+    # shared input are left untouched (--force / --clean rebuild everything).
+    # A page also depends on every other page through page_index ([[links]]),
+    # so any change to the index or config rebuilds every page.
+    inputs_mtime = _latest_mtime(config_path, pages_dir / 'sitemap.md',
+                                 pages_dir / 'widgets.md', __file__)
+    digest = export_digest(page_index, sections_map, internal_keys, theme_params, widgets,
+                           collection_types, valid_types, legacy_sections, sitemap_labels)
+    rebuild_all = args.force or read_export_digest(output_dir) != digest
+    if rebuild_all and not args.force:
+        print("🔁 Page index or config changed since the last export: rebuilding every page")
+    md_files = _list_markdown_files(pages_dir)
+    if rebuild_all:
+        to_convert = md_files
+    else:
+        planned = [
+            (md_file, page_output_path(
+                md_file, output_dir, sections_map,
+                valid_types=valid_types, legacy_sections=legacy_sections,
+                collection_types=collection_types, sitemap_labels=sitemap_labels))
+            for md_file in md_files
+        ]
+        # Pages sharing an output (_index.md) are always rebuilt together so
+        # the last one in page order keeps winning, as in a full export.
+        out_counts = Counter(out for _, out in planned if out is not None)
+        to_convert = []
+        for md_file, out in planned:
+            if (out is not None and out_counts[out] == 1
+                    and _output_is_current(md_file, out, inputs_mtime)):
+                unchanged.append(str(out))
+                continue
+            to_convert.append(md_file)
+
+    # Pages are independent: convert them in a process pool on large graphs.
+    # Workers only render; outputs are written here in sorted page order, so
+    # pages sharing an output (_index.md) resolve exactly as a serial run.
+    render = partial(
+        render_page, output_dir=output_dir, sections_map=sections_map,
+        internal_keys=internal_keys, theme_params=theme_params, widgets=widgets,
+        collection_types=collection_types,
+        valid_types=valid_types, legacy_sections=legacy_sections,
+        page_index=page_index, sitemap_labels=sitemap_labels)
+    # (a single CPU gains nothing and would still pickle page_index per chunk)
+    cpus = os.cpu_count() or 1
+    if len(to_convert) < PARALLEL_MIN_PAGES or cpus < 2:
+        rendered = map(render, to_convert)
+    else:
+        with ProcessPoolExecutor() as executor:
+            rendered = list(executor.map(render, to_convert, chunksize=16))
+        converted = sum(1 for out, _, _ in rendered if out is not None)
+        print(f"  ⚙️  Converted {converted} page(s) in parallel ({cpus} CPU(s))")
+
+    for md_file, (out, data, warnings) in zip(to_convert, rendered):
+        if out is not None:
+            result = str(out)
             exported.append(result)
-            print(f"  ✅ {md_file.name} → {result}")
+            if _write_page(out, data):
+                print(f"  ✅ {md_file.name} → {result}")
+            else:
+                identical += 1
+                print(f"  ✅ {md_file.name} → {result} (identical, not rewritten)")
             if warnings:
                 for w in warnings:
                     print(f"     ⚠️  {w}")
@@ -1678,10 +2127,10 @@ def main():
         journals_dir = graph_dir / 'journals'
         if journals_dir.exists():
             print(f"\n📓 Scanning journal entries for articles…")
-            known_slugs = {Path(p).stem for p in exported if '/blog/' in p or '/curious/' in p}
-            for journal_file in sorted(journals_dir.glob('*.md')):
+            known_slugs = {Path(p).stem for p in exported + unchanged if '/blog/' in p or '/curious/' in p}
+            for journal_file in _list_markdown_files(journals_dir):
                 for page_text, source_label in extract_journal_blocks(journal_file):
-                    result, warnings = process_file(
+                    result, warnings, written = process_file(
                         journal_file, output_dir, sections_map, internal_keys,
                         theme_params=theme_params, widgets=widgets,
                         collection_types=collection_types,
@@ -1695,7 +2144,11 @@ def main():
                             continue
                         known_slugs.add(result_slug)
                         journal_exported.append(result)
-                        print(f"  ✅ {source_label} → {result}")
+                        if written:
+                            print(f"  ✅ {source_label} → {result}")
+                        else:
+                            identical += 1
+                            print(f"  ✅ {source_label} → {result} (identical, not rewritten)")
                         if warnings:
                             for w in warnings:
                                 print(f"     ⚠️  {w}")
@@ -1708,7 +2161,13 @@ def main():
             print(f"\n  ℹ️  No journals/ folder found in {graph_dir}")
     exported.extend(journal_exported)
 
-    print(f"\n📤 Export done: {len(exported)} page(s) exported, {len(skipped)} skipped (no type:: defined)")
+    # Recorded last: an interrupted export leaves the old digest and the
+    # next run rebuilds every page again.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(output_dir / EXPORT_DIGEST_FILE, (digest + '\n').encode('utf-8'))
+
+    print(f"\n📤 Export done: {len(exported)} page(s) exported ({identical} identical, not rewritten), "
+          f"{len(unchanged)} up to date (not converted), {len(skipped)} skipped (no type:: defined)")
     if skipped:
         print(f"   Skipped: {', '.join(skipped)}")
     if all_warnings:
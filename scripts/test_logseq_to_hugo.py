@@ -5,17 +5,24 @@ import unittest
 import sys
 import tempfile
 import os
+import io
+import contextlib
+from unittest import mock
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+import logseq_to_hugo
 from logseq_to_hugo import (
     apply_inline_conversions,
+    make_inline_converter,
     extract_tags,
     convert_content,
+    convert_admonitions,
     build_page_index,
     build_front_matter,
     parse_logseq_properties,
     process_file,
+    up_to_date_output,
     resolve_props,
     load_colors,
     apply_widgets,
@@ -24,6 +31,8 @@ from logseq_to_hugo import (
     DEFAULT_SECTIONS,
     VALID_TYPES,
     _resolve_page_link,
+    _fast_copy,
+    main,
 )
 
 # ──────────────────────────────────────────────
@@ -39,6 +48,15 @@ SAMPLE_PAGE_INDEX = {
 }
 
 
+def run_main(graph, out_dir):
+    """Run the CLI entry point on *graph*; returns what it printed."""
+    argv = ['logseq_to_hugo.py', '--graph', str(graph), '--output', str(out_dir)]
+    stdout = io.StringIO()
+    with mock.patch.object(sys, 'argv', argv), contextlib.redirect_stdout(stdout):
+        main()
+    return stdout.getvalue()
+
+
 # ──────────────────────────────────────────────
 # US-1: Footnotes + ==highlight==
 # ──────────────────────────────────────────────
@@ -187,6 +205,21 @@ class TestBuildPageIndex(unittest.TestCase):
             self.assertEqual(index['MonCV']['section'], 'cv')
             self.assertNotIn('NoType', index)
 
+    def test_index_ignores_non_markdown_entries(self):
+        """Only regular *.md files in pages/ are scanned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pages = Path(tmpdir) / 'pages'
+            pages.mkdir()
+            (pages / 'MonCV.md').write_text(
+                'type:: page\nlang:: fr\nmenu:: cv\n\n- contenu', encoding='utf-8'
+            )
+            (pages / 'Notes.txt').write_text('type:: page\nlang:: fr', encoding='utf-8')
+            (pages / 'Dossier.md').mkdir()
+            index = build_page_index(pages, {'cv': 'cv'})
+            self.assertIn('MonCV', index)
+            self.assertNotIn('Notes', index)
+            self.assertNotIn('Dossier', index)
+
 
 # ──────────────────────────────────────────────
 # US-3: #[[Tag Name]] → taxonomy link
@@ -224,6 +257,16 @@ class TestBracketedTags(unittest.TestCase):
         tags = extract_tags(text)
         self.assertNotIn('section', tags)
 
+    def test_tags_extracted_from_first_line_without_properties(self):
+        """A page without properties block keeps the tags of its first line."""
+        tags = extract_tags("Intro #first\n- more #second")
+        self.assertEqual(tags, ['first', 'second'])
+
+    def test_block_properties_not_extracted_as_tags(self):
+        """Leading - key:: value lines are properties, not body (as in convert_content)."""
+        tags = extract_tags("- type:: article\n- color:: #ff0000\n\n- body #real")
+        self.assertEqual(tags, ['real'])
+
     def test_bracketed_tag_not_treated_as_page_link(self):
         """#[[Tag]] must NOT be resolved as a page link even if a page named 'Tag' exists."""
         page_index = {'Mon Tag': {'lang': 'fr', 'section': 'blog', 'slug': 'mon-tag'}}
@@ -259,6 +302,29 @@ class TestCustomTextLinks(unittest.TestCase):
         self.assertEqual(result, 'Voir [Logseq](https://logseq.com)')
 
 
+# ──────────────────────────────────────────────
+# Per-page inline converter (make_inline_converter)
+# ──────────────────────────────────────────────
+
+class TestInlineConverter(unittest.TestCase):
+    """convert_content builds one inline converter per page and reuses it."""
+
+    def test_inline_converter_reused_across_lines(self):
+        """One per-page converter bakes in lang/page_index and keeps no state between lines."""
+        expected = {
+            'un #Marketing tag': 'un [#Marketing](/en/tags/marketing/) tag',
+            'Voir #[[Mon Tag]] ici': 'Voir [#Mon Tag](/en/tags/mon-tag/) ici',
+            'Lire [[Contact]] ^^#Tea^^': 'Lire [Contact](/fr/contact/contact/) <mark>[#Tea](/en/tags/tea/)</mark>',
+            '[site](https://x.org/#faq) [[Inconnue]]': '[site](https://x.org/#faq) Inconnue',
+            'plain text': 'plain text',
+        }
+        convert = make_inline_converter('en', SAMPLE_PAGE_INDEX)
+        for _ in range(2):
+            for line, want in expected.items():
+                self.assertEqual(convert(line), want)
+                self.assertEqual(make_inline_converter('en', SAMPLE_PAGE_INDEX)(line), want)
+
+
 # ──────────────────────────────────────────────
 # Integration: full convert_content with all features
 # ──────────────────────────────────────────────
@@ -293,6 +359,63 @@ class TestConvertContentIntegration(unittest.TestCase):
         self.assertIn('<mark>aussi</mark>', result)
 
 
+# ──────────────────────────────────────────────
+# Admonitions #+BEGIN_X ... #+END_X → blockquote callouts
+# ──────────────────────────────────────────────
+
+class TestAdmonitions(unittest.TestCase):
+    """Pairing rules of convert_admonitions (BEGIN/END markers)."""
+
+    def test_block_becomes_callout(self):
+        result = convert_admonitions('#+BEGIN_NOTE\nA retenir\n#+END_NOTE')
+        self.assertEqual(result, '> **📝 NOTE**\n>\n> A retenir')
+
+    def test_unclosed_block_left_as_is(self):
+        text = '#+BEGIN_NOTE\nsans fin\n'
+        self.assertEqual(convert_admonitions(text), text)
+
+    def test_unclosed_block_does_not_hide_later_block(self):
+        result = convert_admonitions('#+BEGIN_NOTE\nopen\n#+BEGIN_TIP\nok\n#+END_TIP')
+        self.assertEqual(result, '#+BEGIN_NOTE\nopen\n> **💡 TIP**\n>\n> ok')
+
+    def test_lowercase_markers(self):
+        result = convert_admonitions('#+begin_tip\nastuce\n#+end_tip')
+        self.assertEqual(result, '> **💡 TIP**\n>\n> astuce')
+
+    def test_end_marker_with_suffix(self):
+        """#+END_NOTES closes a NOTE block; the extra letters are kept."""
+        result = convert_admonitions('#+BEGIN_NOTE\nx\n#+END_NOTES')
+        self.assertEqual(result, '> **📝 NOTE**\n>\n> xS')
+
+    def test_nested_begin_stays_inside_outer_block(self):
+        text = '#+BEGIN_NOTE\nouter\n#+BEGIN_TIP\ninner\n#+END_TIP\n#+END_NOTE'
+        self.assertEqual(
+            convert_admonitions(text),
+            '> **📝 NOTE**\n>\n> outer\n> #+BEGIN_TIP\n> inner\n> #+END_TIP',
+        )
+
+
+# ──────────────────────────────────────────────
+# Line endings: Windows-edited (CRLF) pages
+# ──────────────────────────────────────────────
+
+class TestCrlfPages(unittest.TestCase):
+    """Pages saved with CRLF line endings convert like LF pages."""
+
+    def test_crlf_page_renders_admonition(self):
+        """Windows-edited (CRLF) pages must still render #+BEGIN_X blocks."""
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / 'Windows.md'
+            src.write_bytes(b'type:: article\r\nmenu:: blog\r\nlang:: fr\r\n\r\n'
+                            b'- #+BEGIN_NOTE\r\nA retenir\r\n#+END_NOTE\r\n')
+            result, _, _ = process_file(src, Path(tmp) / 'content', {'blog': 'blog'},
+                                        DEFAULT_INTERNAL_KEYS)
+            output = Path(result).read_text(encoding='utf-8')
+            self.assertIn('> **📝 NOTE**', output)
+            self.assertNotIn('#+BEGIN_NOTE', output)
+            self.assertNotIn('\r', output)
+
+
 # ──────────────────────────────────────────────
 # Logseq date normalisation in front matter
 # ──────────────────────────────────────────────
@@ -343,25 +466,202 @@ class TestPublishOptOut(unittest.TestCase):
 
     def test_public_false_skips_page(self):
         text = 'type:: article\nmenu:: blog\nlang:: fr\ndate:: 2026-04-01\npublic:: false\n\nContent here.'
-        result, _ = self._run(text)
+        result, _, _ = self._run(text)
         self.assertIsNone(result)
 
     def test_draft_true_skips_page(self):
         text = 'type:: article\nmenu:: blog\nlang:: fr\ndate:: 2026-04-01\ndraft:: true\n\nContent here.'
-        result, _ = self._run(text)
+        result, _, _ = self._run(text)
         self.assertIsNone(result)
 
     def test_public_true_publishes(self):
         text = 'type:: article\nmenu:: blog\nlang:: fr\ndate:: 2026-04-01\npublic:: true\n\nContent here.'
-        result, _ = self._run(text)
+        result, _, _ = self._run(text)
         self.assertIsNotNone(result)
 
     def test_no_opt_out_publishes(self):
         text = 'type:: article\nmenu:: blog\nlang:: fr\ndate:: 2026-04-01\n\nContent here.'
-        result, _ = self._run(text)
+        result, _, _ = self._run(text)
         self.assertIsNotNone(result)
 
 
+# ──────────────────────────────────────────────
+# Incremental export: up-to-date pages are skipped
+# ──────────────────────────────────────────────
+
+class TestIncrementalExport(unittest.TestCase):
+    """Pages whose output is newer than the source must not be rebuilt."""
+
+    SECTIONS_MAP = {'blog': 'blog'}
+    TEXT = 'type:: article\nmenu:: blog\nlang:: fr\ntitle:: Mon article\n\nContent here.'
+
+    def _export(self, tmp):
+        src = Path(tmp) / 'Mon article.md'
+        src.write_text(self.TEXT, encoding='utf-8')
+        out_dir = Path(tmp) / 'content'
+        result, _, _ = process_file(src, out_dir, self.SECTIONS_MAP, DEFAULT_INTERNAL_KEYS)
+        return src, out_dir, Path(result)
+
+    def test_output_newer_than_source_is_up_to_date(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            os.utime(src, (1000, 1000))
+            self.assertEqual(up_to_date_output(src, out_dir, self.SECTIONS_MAP), str(out))
+
+    def test_source_newer_than_output_needs_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            os.utime(out, (1000, 1000))
+            self.assertIsNone(up_to_date_output(src, out_dir, self.SECTIONS_MAP))
+
+    def test_shared_input_newer_than_output_needs_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            os.utime(src, (1000, 1000))
+            os.utime(out, (2000, 2000))
+            self.assertIsNone(up_to_date_output(src, out_dir, self.SECTIONS_MAP, inputs_mtime=3000))
+
+    def test_missing_output_needs_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            out.unlink()
+            self.assertIsNone(up_to_date_output(src, out_dir, self.SECTIONS_MAP))
+
+    def test_identical_output_not_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            _, _, written = process_file(src, out_dir, self.SECTIONS_MAP, DEFAULT_INTERNAL_KEYS)
+            self.assertFalse(written)
+
+    def test_changed_output_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, out_dir, out = self._export(tmp)
+            src.write_text(self.TEXT + '\nMore content.', encoding='utf-8')
+            _, _, written = process_file(src, out_dir, self.SECTIONS_MAP, DEFAULT_INTERNAL_KEYS)
+            self.assertTrue(written)
+            self.assertIn('More content.', out.read_text(encoding='utf-8'))
+
+    def test_publishing_linked_page_rebuilds_linking_page(self):
+        """[[Future]] must become a link once Future.md is published, even
+        though the linking page itself did not change."""
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = Path(tmp) / 'graph' / 'pages'
+            pages.mkdir(parents=True)
+            out_dir = Path(tmp) / 'site' / 'content'
+            linker = pages / 'Linker.md'
+            linker.write_text('type:: article\nmenu:: blog\nlang:: fr\n\n- voir [[Future]]',
+                              encoding='utf-8')
+            future = pages / 'Future.md'
+            future.write_text('lang:: fr\n\n- brouillon', encoding='utf-8')
+            run_main(Path(tmp) / 'graph', out_dir)
+            out = out_dir / 'fr' / 'blog' / 'linker.md'
+            self.assertNotIn('](/fr/blog/future/)', out.read_text(encoding='utf-8'))
+
+            os.utime(linker, (1000, 1000))
+            future.write_text('type:: article\nmenu:: blog\nlang:: fr\n\n- publié', encoding='utf-8')
+            run_main(Path(tmp) / 'graph', out_dir)
+            self.assertIn('[Future](/fr/blog/future/)', out.read_text(encoding='utf-8'))
+
+    def test_new_journal_file_does_not_rebuild_pages(self):
+        """Logseq creates a journal file every day: pages must stay up to date."""
+        with tempfile.TemporaryDirectory() as tmp:
+            graph = Path(tmp) / 'graph'
+            (graph / 'pages').mkdir(parents=True)
+            (graph / 'journals').mkdir()
+            (graph / 'config.yaml').write_text('journal_articles: true\n', encoding='utf-8')
+            (graph / 'pages' / 'Article.md').write_text(
+                'type:: article\nmenu:: blog\nlang:: fr\n\n- contenu', encoding='utf-8')
+            out_dir = Path(tmp) / 'site' / 'content'
+            run_main(graph, out_dir)
+            (graph / 'journals' / '2026_10_15.md').write_text('- une note', encoding='utf-8')
+            self.assertIn('1 up to date', run_main(graph, out_dir))
+
+    def test_pages_sharing_an_output_are_rebuilt_together(self):
+        """When one of two pages sharing _index.md changes, the last one still wins."""
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = Path(tmp) / 'graph' / 'pages'
+            pages.mkdir(parents=True)
+            first, last = pages / 'A.md', pages / 'B.md'
+            for src in (first, last):
+                src.write_text(f'type:: page\nmenu:: blog\nlang:: fr\n\n- contenu {src.stem}',
+                               encoding='utf-8')
+            out_dir = Path(tmp) / 'site' / 'content'
+            run_main(Path(tmp) / 'graph', out_dir)
+            os.utime(last, (1000, 1000))
+            first.write_text('type:: page\nmenu:: blog\nlang:: fr\n\n- contenu A modifié',
+                             encoding='utf-8')
+            run_main(Path(tmp) / 'graph', out_dir)
+            index = (out_dir / 'fr' / 'blog' / '_index.md').read_text(encoding='utf-8')
+            self.assertIn('contenu B', index)
+
+
+# ──────────────────────────────────────────────
+# Parallel export: workers render, the parent writes in page order
+# ──────────────────────────────────────────────
+
+class TestParallelExport(unittest.TestCase):
+    """The process-pool path must produce the same tree as a serial run."""
+
+    def test_shared_index_written_by_last_page(self):
+        """Two pages mapping to fr/blog/_index.md: the last one (sorted) wins."""
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = Path(tmp) / 'graph' / 'pages'
+            pages.mkdir(parents=True)
+            for name in ('A', 'B', 'C'):
+                (pages / f'{name}.md').write_text(
+                    f'type:: page\nmenu:: blog\nlang:: fr\n\n- contenu {name}', encoding='utf-8')
+            out_dir = Path(tmp) / 'site' / 'content'
+            with mock.patch.object(logseq_to_hugo, 'PARALLEL_MIN_PAGES', 1), \
+                    mock.patch('os.cpu_count', return_value=4):
+                run_main(Path(tmp) / 'graph', out_dir)
+            index = (out_dir / 'fr' / 'blog' / '_index.md').read_text(encoding='utf-8')
+            self.assertIn('contenu C', index)
+            self.assertNotIn('contenu A', index)
+
+
+# ──────────────────────────────────────────────
+# Assets: copy only new or changed files
+# ──────────────────────────────────────────────
+
+class TestFastCopy(unittest.TestCase):
+    """_fast_copy skips assets whose copy has the same size and is newer."""
+
+    def _src(self, tmp, data=b'image-bytes', mtime=1000):
+        src = Path(tmp) / 'photo.png'
+        src.write_bytes(data)
+        os.utime(src, (mtime, mtime))
+        return src, Path(tmp) / 'copy.png'
+
+    def test_first_copy_carries_source_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = self._src(tmp)
+            self.assertTrue(_fast_copy(src, dst))
+            self.assertEqual(dst.read_bytes(), b'image-bytes')
+            self.assertEqual(dst.stat().st_mtime, 1000)
+
+    def test_second_copy_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = self._src(tmp)
+            _fast_copy(src, dst)
+            self.assertFalse(_fast_copy(src, dst))
+
+    def test_same_size_newer_source_copied_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = self._src(tmp)
+            _fast_copy(src, dst)
+            src.write_bytes(b'IMAGE-BYTES')
+            os.utime(src, (2000, 2000))
+            self.assertTrue(_fast_copy(src, dst))
+            self.assertEqual(dst.read_bytes(), b'IMAGE-BYTES')
+
+    def test_force_always_copies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = self._src(tmp)
+            _fast_copy(src, dst)
+            self.assertTrue(_fast_copy(src, dst, force=True))
+            self.assertTrue(_fast_copy(src, dst, force=True))
+
+
 # ──────────────────────────────────────────────
 # Safety net: unknown {{...}} macros
 # ──────────────────────────────────────────────